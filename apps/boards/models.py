@@ -104,6 +104,10 @@ class Card(models.Model):
 
     class Meta:
         ordering = ['priority', 'order']
+        indexes = [
+            # Matches the per-list prefetch: WHERE list_id IN (...) ORDER BY priority, order
+            models.Index(fields=['list', 'priority', 'order']),
+        ]
 
     def move_to(self, new_list):
         """
@@ -143,6 +147,7 @@ class Membership(models.Model):
         (ROLE_MEMBER, "Member"),
         (ROLE_VIEWER, "Viewer"),
     ]
+    _VALID_ROLES = frozenset(role for role, _ in ROLE_CHOICES)
 
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -189,6 +194,7 @@ class Membership(models.Model):
         indexes = [
             models.Index(fields=["board", "role"]),
             models.Index(fields=["user"]),
+            models.Index(fields=["user", "is_active", "board"]),
         ]
         ordering = ["role", "created_at"]
         verbose_name = "Board membership"
@@ -202,13 +208,14 @@ class Membership(models.Model):
         return self.role == self.ROLE_OWNER
 
     def is_admin(self):
-        return self.role in {self.ROLE_OWNER, self.ROLE_ADMIN}
+        # Lower value = more privileges, so Owner and Admin are both <= ROLE_ADMIN.
+        return self.role <= self.ROLE_ADMIN
 
     def promote(self, new_role):
         """
         Promote or change role. Validate allowed transitions here if needed.
         """
-        if new_role not in dict(self.ROLE_CHOICES):
+        if new_role not in self._VALID_ROLES:
             raise ValueError("Invalid role value")
         self.role = new_role
         self.save(update_fields=["role", "updated_at"])
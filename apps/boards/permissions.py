@@ -1,50 +1,108 @@
+import logging
+from typing import Callable, NamedTuple
 from django.views import View
 from django.shortcuts import get_object_or_404
 from django.http import JsonResponse
-from django.db.models import Max, Prefetch
+from django.db.models import Max, Prefetch, Exists, OuterRef, Subquery, Q
 from django.db import transaction
 from django.template.loader import render_to_string
-from custom_tools.logger import custom_logger
-from .forms import *
-from colorama import Fore
 from django.core.exceptions import ValidationError
 from django.core.exceptions import PermissionDenied
 from django.http import Http404
+from apps.accounts.models import User
 from .models import Board, List, Card, Membership
 
 
+__all__ = [
+    "get_board_membership",
+    "get_user_boards",
+    "get_user_board",
+    "get_board_lists",
+    "get_user_list",
+    "can_modify_board",
+    "is_owner_or_member",
+    "get_user_card_for_read",
+    "get_user_card_for_update",
+    "get_next_order",
+    "reserve_next_card_order",
+    "render_partial_response",
+    "BoardMemberRequiredMixin",
+    "BoardAdminRequiredMixin",
+    "BoardObjectPermissionMixin",
+    "BoardReadWritePermissionMixin",
+]
+
+logger = logging.getLogger(__name__)
+
+# Roles allowed to administer a board (edit it, manage its members).
+_ADMIN_ROLES = frozenset((Membership.ROLE_OWNER, Membership.ROLE_ADMIN))
+# Roles allowed to change board content (lists, cards); everyone but viewers.
+_WRITE_ROLES = _ADMIN_ROLES | {Membership.ROLE_MEMBER}
+
 
 # Helper functions to avoid repetition
+def get_board_membership(user, board):
+    """
+    Return the user's active Membership on `board` (a Board or its id), or None.
+
+    The result is memoized on the user object, so the mixins and helpers
+    below share a single query per board for the lifetime of a request.
+    """
+    board_id = getattr(board, "pk", board)
+    cache = getattr(user, "_board_memberships", None)
+    if cache is None:
+        cache = user._board_memberships = {}
+    if board_id not in cache:
+        # Authorization only needs the role; skip the invitation/permission-flag columns.
+        cache[board_id] = (
+            Membership.objects.select_related("board")
+            .only("id", "role", "is_active", "user", "board")
+            .filter(board_id=board_id, user=user, is_active=True)
+            .first()
+        )
+    return cache[board_id]
+
+
 def get_user_boards(user):
     """Get all boards for a user with optimized queries"""
+    # EXISTS is a semi-join: one row per board, so no DISTINCT is needed.
+    active_membership = Membership.objects.filter(
+        board=OuterRef("pk"), user=user, is_active=True
+    )
     boards = (
-        Board.objects.filter(memberships__user=user, memberships__is_active=True)
+        Board.objects.filter(Exists(active_membership))
         .select_related("owner")
-        .prefetch_related("memberships")
-        .distinct()
+        .prefetch_related(
+            Prefetch(
+                "memberships",
+                queryset=Membership.objects.filter(is_active=True).select_related("user"),
+                to_attr="active_memberships",
+            )
+        )
     )
-    custom_logger(f"Retrieved {boards.count()} boards for user `{user.email}`")
-    custom_logger(f"Boards: {boards}")
     return boards
 
 
 def get_user_board(board_id, user):
     """Get a specific board for a user with permission check"""
-    try:
-        board = get_object_or_404(Board, id=board_id)
-        return board if is_owner_or_member(board_id, user, Board) else False
-    except Board.DoesNotExist:
-        raise Http404("Board not found")
+    board = get_object_or_404(Board, id=board_id)
+    return board if is_owner_or_member(board, user) else False
 
 def get_board_lists(board):
     """Get all lists for a board with optimized queries and preloaded cards"""
+    # The related manager hands every list the caller's board instance, so no board JOIN is needed.
     lists = (
-        List.objects.filter(board=board)
-        .select_related("board")
+        board.lists.all()
         .prefetch_related(
             Prefetch(
                 'cards',
-                queryset=Card.objects.prefetch_related("assignees").order_by("priority", "order"),
+                # card_item.html renders title, description and due_date; only
+                # the bookkeeping columns are never shown.
+                queryset=Card.objects.defer(
+                    "created_at", "updated_at", "version"
+                ).prefetch_related(
+                    Prefetch("assignees", queryset=User.objects.only("id", "email", "username"))
+                ).order_by("priority", "order"),
                 to_attr='prefetched_cards'
             )
         )
@@ -55,74 +113,89 @@ def get_board_lists(board):
 
 def get_user_list(list_id, user, board):
     """Get a specific list for a user with permission check, ensuring it belongs to the given board"""
-    
-    if is_owner_or_member(list_id, user, List):
-        return get_object_or_404(
-            List,
-            id=list_id,
-            board=board, # Explicitly filter by the board object
-        )
-    return False
+    board_list = get_object_or_404(
+        List,
+        id=list_id,
+        board=board, # Explicitly filter by the board object
+    )
+    return board_list if is_owner_or_member(board_list, user) else False
 
 def can_modify_board(board, user):
     """
     Check if user has permission to modify (update/delete) the board
     """
-    # Check if user is owner
-    if board.owner == user:
+    # Check if user is owner (compare ids so the owner row is never loaded)
+    if board.owner_id == user.pk:
         return True
     
-    # Check if user is admin
-    membership = board.memberships.filter(user=user, is_active=True).first()
-    custom_logger(f"method: can_modify_board/nMembership: {membership.role}", Fore.YELLOW)
-    return membership and membership.role in [Membership.ROLE_OWNER, Membership.ROLE_ADMIN]
+    # Check if user is admin (a missing membership simply means "no")
+    membership = get_board_membership(user, board)
+    return membership is not None and membership.role in _ADMIN_ROLES
+
+def _board_id_of(obj):
+    """Return the board id of a Card, List or Board without touching the database."""
+    if isinstance(obj, Board):
+        return obj.pk
+    if isinstance(obj, List):
+        return obj.board_id
+    if isinstance(obj, Card):
+        return obj.list.board_id
+    raise ValidationError("Invalid model class")
+
 
-def is_owner_or_member(obj_id, user, model_class=None) -> bool:
+def is_owner_or_member(obj, user) -> bool:
     """
-    Check if the user is the owner or a member of the object.
-        . At this level created for Card, List, Board
+    Check if the user is the owner or a member of the object's board.
+        . At this level created for Card, List, Board instances
     """
     if not user.is_authenticated:
         raise PermissionDenied("You must be logged in to perform this action.")
-    
-    
-    result = False
-    if model_class:
-        if model_class == Card:
-            board_of_this_card = model_class.objects.get(id=obj_id).list.board
-            result = True if board_of_this_card.owner == user \
-                or board_of_this_card.memberships.filter(user=user, is_active=True).exists()\
-                else False
-
-        elif model_class == List:
-            board_of_this_list = model_class.objects.get(id=obj_id).board
-            result = True if board_of_this_list.owner == user \
-                or board_of_this_list.memberships.filter(user=user, is_active=True).exists()\
-                else False
-        elif model_class == Board:
-            result = True if model_class.objects.get(id=obj_id).owner == user \
-                or model_class.objects.get(id=obj_id).memberships.filter(user=user, is_active=True).exists()\
-                else False
-
-        if not result:
-            raise PermissionDenied("You are not authorized to perform this action")
-        return result
-    raise ValidationError("Invalid model class")
 
+    board_id = _board_id_of(obj)
+    if isinstance(obj, Board) and obj.owner_id == user.pk:
+        result = True
+    else:
+        # One EXISTS query: the board is owned by, or has an active membership for, the user.
+        active_membership = Membership.objects.filter(
+            board=OuterRef("pk"), user=user, is_active=True
+        )
+        result = Board.objects.filter(pk=board_id).filter(
+            Q(owner=user) | Q(Exists(active_membership))
+        ).exists()
+
+    if not result:
+        raise PermissionDenied("You are not authorized to perform this action")
+    return result
+
+
+def _get_user_card(card_id, user, for_update):
+    """Shared body of get_user_card_for_read / get_user_card_for_update."""
+    queryset = Card.objects.select_related("list__board")
+    if for_update:
+        # Lock only the card row, not the joined list/board rows.
+        queryset = queryset.select_for_update(of=("self",))
+    try:
+        card = queryset.get(id=card_id)
+    except Card.DoesNotExist:
+        raise Http404("Card not found")
+    is_o_or_m = is_owner_or_member(card, user)
+    logger.debug("is_owner_or_member(card=%s, user=%s) -> %s", card_id, user.pk, is_o_or_m)
+    return card
 
-@transaction.atomic
-def get_user_card(card_id, user):
-    """Get a specific card for a user with permission check"""
-    is_o_or_m = is_owner_or_member(card_id, user, Card)
-    custom_logger(is_o_or_m, Fore.MAGENTA)
-    if is_o_or_m:
-        if card_id:
-            try:
-                card = Card.objects.select_for_update().get(id=card_id)
-                return card
-            except Card.DoesNotExist:
-                pass
-    raise Http404("Card not found")
+
+def get_user_card_for_read(card_id, user):
+    """Get a specific card for a user with permission check, without locking it"""
+    return _get_user_card(card_id, user, for_update=False)
+
+
+def get_user_card_for_update(card_id, user):
+    """
+    Get a specific card for a user with permission check and lock its row.
+
+    Must be called inside the caller's `transaction.atomic()` block that
+    performs the mutation; the lock is held until that block ends.
+    """
+    return _get_user_card(card_id, user, for_update=True)
 
 
 def get_next_order(model_class, filter_kwargs):
@@ -133,6 +206,19 @@ def get_next_order(model_class, filter_kwargs):
     return max_order + 1
 
 
+@transaction.atomic
+def reserve_next_card_order(list_id):
+    """
+    Reserve the next card order number for a list.
+
+    Locks the list row before reading the highest card order, so concurrent
+    card creations in the same list queue up instead of receiving the same
+    value. Call it inside the transaction that saves the card.
+    """
+    List.objects.select_for_update().values_list("pk", flat=True).get(pk=list_id)
+    return get_next_order(Card, {"list_id": list_id})
+
+
 def render_partial_response(template_name, context):
     """Render a partial template and return JSON response"""
     html = render_to_string(template_name, context)
@@ -151,15 +237,12 @@ class BoardMemberRequiredMixin:
         if not board_id:
             raise ValueError("BoardMemberRequiredMixin requires a 'board_id' in the URL.")
 
-        try:
-            # Try to get the board only if the user is a member.
-            self.board = Board.objects.filter(
-                memberships__user=request.user, 
-                memberships__is_active=True
-            ).distinct().get(pk=board_id)
-        except Board.DoesNotExist:
+        # Get the board only if the user is a member (one query, cached per request).
+        membership = get_board_membership(request.user, board_id)
+        if membership is None:
             # ❗❗❗ BEHAVIOR CHANGE: Raise Http404 for non-members.
             raise Http404("Board not found or you are not a member.")
+        self.board = membership.board
             
         return super().dispatch(request, *args, **kwargs)
 
@@ -180,23 +263,25 @@ class BoardAdminRequiredMixin:
         if not board_id:
             raise ValueError("BoardAdminRequiredMixin requires a 'board_id' in the URL.")
 
-        try:
-            # Same logic as above: find the board through membership first.
-            board = Board.objects.filter(
-                memberships__user=request.user,
-                memberships__is_active=True
-            ).select_related('owner').distinct().get(pk=board_id)
-        except Board.DoesNotExist:
+        # One query: the board plus the user's active role on it (None if not a member).
+        board = (
+            Board.objects.filter(pk=board_id)
+            .select_related('owner')
+            .annotate(
+                my_role=Subquery(
+                    Membership.objects.filter(
+                        board=OuterRef('pk'), user=request.user, is_active=True
+                    ).values('role')[:1]
+                )
+            )
+            .first()
+        )
+        is_owner = board is not None and board.owner_id == request.user.pk
+        if board is None or (board.my_role is None and not is_owner):
             raise Http404("Board not found or you are not a member.")
-        
-        # Now that we know the user is a member, check their role.
-        if board.owner == request.user:
-            self.board = board
-            return super().dispatch(request, *args, **kwargs)
-        
-        membership = board.memberships.get(user=request.user)
-        if membership.role not in [Membership.ROLE_OWNER, Membership.ROLE_ADMIN]:
 
+        # Now that we know the user is a member, check their role.
+        if not is_owner and board.my_role not in _ADMIN_ROLES:
             raise PermissionDenied("You do not have permission to perform this action.")
         
         self.board = board
@@ -205,6 +290,21 @@ class BoardAdminRequiredMixin:
 
 
 
+class _ObjectPermissionConfig(NamedTuple):
+    """How BoardObjectPermissionMixin loads a model and finds its board."""
+    select_related: tuple
+    prefetch_related: tuple
+    board_path: str  # OuterRef path to the board, for the membership EXISTS
+    get_board: Callable
+
+
+_OBJECT_PERMISSION_CONFIG = {
+    Card: _ObjectPermissionConfig(('list__board__owner',), ('assignees',), 'list__board', lambda obj: obj.list.board),
+    List: _ObjectPermissionConfig(('board__owner',), (), 'board', lambda obj: obj.board),
+    Board: _ObjectPermissionConfig(('owner',), (), 'pk', lambda obj: obj),
+}
+
+
 class BoardObjectPermissionMixin(View):
     """
     A flexible mixin that verifies the logged-in user has permission to access
@@ -235,14 +335,23 @@ class BoardObjectPermissionMixin(View):
         Raises:
             ValueError: If board cannot be determined from object
         """
-        if isinstance(obj, Board):
-            return obj
-        elif isinstance(obj, List):
-            return obj.board
-        elif isinstance(obj, Card):
-            return obj.list.board
-        else:
+        config = _OBJECT_PERMISSION_CONFIG.get(type(obj))
+        if config is None:
             raise ValueError(f"Cannot determine board from {obj.__class__.__name__}")
+        return config.get_board(obj)
+
+    def get_membership_exists(self, user, board_path):
+        """
+        Build an EXISTS expression telling whether `user` is an active member
+        of the board reached through `board_path` on the queried model.
+        """
+        return Exists(
+            Membership.objects.filter(
+                board=OuterRef(board_path),
+                user=user,
+                is_active=True
+            )
+        )
     
     def dispatch(self, request, *args, **kwargs):
         """
@@ -258,10 +367,7 @@ class BoardObjectPermissionMixin(View):
         """
         # 1. Authentication check with proper error handling
         if not request.user.is_authenticated:
-            custom_logger(
-                f"Unauthenticated access attempt to {self.__class__.__name__}",
-                Fore.RED
-            )
+            logger.warning("Unauthenticated access attempt to %s", self.__class__.__name__)
             from django.contrib.auth.views import redirect_to_login
             return redirect_to_login(request.get_full_path())
         
@@ -285,33 +391,23 @@ class BoardObjectPermissionMixin(View):
         # 4. Retrieve object with optimized queries
         try:
             # Use select_related for foreign key relationships to avoid N+1 queries
-            if self.model_to_check == Card:
-                obj = get_object_or_404(
-                    self.model_to_check.objects.select_related(
-                        'list__board__owner'
-                    ).prefetch_related('assignees'),
-                    pk=obj_id
-                )
-            elif self.model_to_check == List:
-                obj = get_object_or_404(
-                    self.model_to_check.objects.select_related(
-                        'board__owner'
-                    ),
-                    pk=obj_id
-                )
-            elif self.model_to_check == Board:
-                obj = get_object_or_404(
-                    self.model_to_check.objects.select_related('owner'),
-                    pk=obj_id
+            # and annotate membership so the object and the permission check share one query
+            config = _OBJECT_PERMISSION_CONFIG.get(self.model_to_check)
+            if config is not None:
+                queryset = self.model_to_check.objects.select_related(
+                    *config.select_related
+                ).prefetch_related(*config.prefetch_related).annotate(
+                    is_member=self.get_membership_exists(request.user, config.board_path)
                 )
             else:
                 # Fallback for other models
-                obj = get_object_or_404(self.model_to_check, pk=obj_id)
+                queryset = self.model_to_check
+            obj = get_object_or_404(queryset, pk=obj_id)
                 
         except (ValueError, TypeError) as e:
-            custom_logger(
-                f"Invalid object ID '{obj_id}' for model {self.model_to_check.__name__}: {e}",
-                Fore.YELLOW
+            logger.warning(
+                "Invalid object ID '%s' for model %s: %s",
+                obj_id, self.model_to_check.__name__, e
             )
             raise Http404("Invalid object ID")
         
@@ -319,33 +415,21 @@ class BoardObjectPermissionMixin(View):
         try:
             board = self.get_board_from_object(obj)
         except ValueError as e:
-            custom_logger(
-                f"Failed to get board from {obj.__class__.__name__}({obj_id}): {e}",
-                Fore.RED
+            logger.error(
+                "Failed to get board from %s(%s): %s", obj.__class__.__name__, obj_id, e
             )
             raise Http404("Board not found")
         
-        # 6. Check board membership with optimized query
-        try:
-            is_member = board.memberships.filter(
-                user=request.user, 
-                is_active=True
-            ).exists()
-            
-            if not is_member:
-                custom_logger(
-                    f"User {request.user.email} denied access to "
-                    f"{obj.__class__.__name__}({obj_id}) on board '{board.title}': "
-                    "Not a board member",
-                    Fore.YELLOW
-                )
-                raise PermissionDenied("must be a member of this board")
-                
-        except Exception as e:
-            custom_logger(
-                f"Error checking membership for user {request.user.email} "
-                f"on board '{board.title}': {e}",
-                Fore.RED
+        # 6. Check board ownership/membership. The membership flag was annotated onto the
+        #    object in step 4, so no further query is needed (other models fall back to a lookup).
+        is_member = board.owner_id == request.user.pk or getattr(obj, 'is_member', None)
+        if is_member is None:
+            is_member = get_board_membership(request.user, board) is not None
+
+        if not is_member:
+            logger.info(
+                "User %s denied access to %s(%s) on board %s: Not a board member",
+                request.user.pk, obj.__class__.__name__, obj_id, board.pk
             )
             raise PermissionDenied("must be a member of this board")
         
@@ -353,10 +437,9 @@ class BoardObjectPermissionMixin(View):
         self.board = board
         self.object = obj
         
-        custom_logger(
-            f"User {request.user.email} granted access to "
-            f"{obj.__class__.__name__}({obj_id}) on board '{board.title}'",
-            Fore.GREEN
+        logger.debug(
+            "User %s granted access to %s(%s) on board %s",
+            request.user.pk, obj.__class__.__name__, obj_id, board.pk
         )
         
         return super().dispatch(request, *args, **kwargs)
@@ -376,14 +459,15 @@ class BoardReadWritePermissionMixin:
         response = super().dispatch(request, *args, **kwargs)
 
         # Now, perform the more specific role check.
-        try:
-            membership = self.board.memberships.get(user=request.user, is_active=True)
-            if membership.role > Membership.ROLE_MEMBER: # ROLE_VIEWER has a higher value (40 > 30)
+        # The membership was already looked up (and cached) by BoardMemberRequiredMixin.
+        membership = get_board_membership(request.user, self.board)
+        if membership is not None:
+            if membership.role not in _WRITE_ROLES:
                 raise PermissionDenied("You do not have permission to modify content on this board.")
-        except Membership.DoesNotExist:
+        else:
             # This case should technically be caught by BoardMemberRequiredMixin,
             # but we handle it here for safety.
-            if self.board.owner != request.user:
+            if self.board.owner_id != request.user.pk:
                  raise PermissionDenied("You do not have permission to modify content on this board.")
 
         return response
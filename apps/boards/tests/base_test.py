@@ -1,5 +1,6 @@
 from django.test import TestCase
 from django.conf import settings
+from django.contrib.auth.hashers import make_password
 from apps.accounts.models import User
 from apps.boards.models import Board, List, Card, Membership
 
@@ -12,6 +13,21 @@ class BaseTestCase(TestCase):
     pass
 
 
+class BaseModelTestCase(BaseTestCase):
+    """
+    A minimal, shared fixture for model and form tests:
+    one user owning one board, with one list, one card and an owner membership.
+    Built once per class; Django isolates each test's changes.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('testuser', email='test@example.com', password='password')
+        cls.board = Board.objects.create(owner=cls.user, title='Test Board', color='blue')
+        cls.list_obj = List.objects.create(board=cls.board, title='Test List', order=1)
+        cls.card = Card.objects.create(list=cls.list_obj, title='Test Card', order=1)
+        cls.membership = Membership.objects.create(user=cls.user, board=cls.board, role=Membership.ROLE_OWNER)
+
+
 
 class BaseBoardTestCase(BaseTestCase):
     """
@@ -19,8 +35,7 @@ class BaseBoardTestCase(BaseTestCase):
     
     This class reduces code duplication by creating a comprehensive set of objects:
     - Users: An owner, a member, a non-member, and other users for various scenarios.
-    - Boards: A primary board for detailed testing, a secondary board for access separation,
-      and a set of additional boards to test user limits.
+    - Boards: A primary board for detailed testing and a secondary board for access separation.
     - Lists & Cards: A populated structure within the primary board.
     - Memberships: Clear roles for users on the primary board.
     
@@ -43,61 +58,67 @@ class BaseBoardTestCase(BaseTestCase):
     @classmethod
     def _create_users(cls):
         """Create a standard set of users with clear roles."""
-        cls.owner = User.objects.create_user(username='board_owner', email='owner@test.com', password='p')
-        cls.member = User.objects.create_user(username='board_member', email='member@test.com', password='p')
-        cls.non_member = User.objects.create_user(username='non_member', email='nonmember@test.com', password='p')
-        # This user will own the secondary board and can be used for invitation/membership limit tests
-        cls.another_user = User.objects.create_user(username='another_user', email='another@test.com', password='p')
-        cls.board_admin = User.objects.create_user(username='board_admin', email='board_admin@test.com', password='p')
-        cls.board_viewer = User.objects.create_user(username='board_viewer', email='board_viewer@test.com', password='p')
+        # Hash the shared password once; create_user would re-hash it for every user.
+        password = make_password('p')
+        (
+            cls.owner,
+            cls.member,
+            cls.non_member,
+            # This user will own the secondary board and can be used for invitation/membership limit tests
+            cls.another_user,
+            cls.board_admin,
+            cls.board_viewer,
+        ) = User.objects.bulk_create([
+            User(username='board_owner', email='owner@test.com', password=password),
+            User(username='board_member', email='member@test.com', password=password),
+            User(username='non_member', email='nonmember@test.com', password=password),
+            User(username='another_user', email='another@test.com', password=password),
+            User(username='board_admin', email='board_admin@test.com', password=password),
+            User(username='board_viewer', email='board_viewer@test.com', password=password),
+        ])
 
     @classmethod
     def _create_boards(cls):
-        """Create a primary board, a secondary board, and extra boards for limit testing."""
-        # The main board used for most tests (CRUD on lists, cards, etc.)
-        cls.board = Board.objects.create(
-            owner=cls.owner,
-            title='Primary Test Board',
-            color='blue'
-        )
-
-        # A secondary board to test access control (e.g., owner/member of cls.board cannot see this)
-        cls.other_board = Board.objects.create(
-            owner=cls.another_user,
-            title='Secondary Board (Private)',
-            color='green'
-        )
-
-        # Create boards up to the user limit for the owner user, for testing creation limits
+        """Create a primary board and a secondary board."""
+        cls.board, cls.other_board = Board.objects.bulk_create([
+            # The main board used for most tests (CRUD on lists, cards, etc.)
+            Board(owner=cls.owner, title='Primary Test Board', color='blue'),
+            # A secondary board to test access control (e.g., owner/member of cls.board cannot see this)
+            Board(owner=cls.another_user, title='Secondary Board (Private)', color='green'),
+        ])
+        # Only BoardLimitTestCase fills the owner up to MAX_BOARDS_PER_USER.
         cls.owner_extra_boards = []
-        # We already created one board for the owner, so we create MAX-1 more.
-        for i in range(cls.max_board_per_user - 1):
-            board = Board.objects.create(
-                owner=cls.owner,
-                title=f'Owner Board {i+2}',
-                color='red'
-            )
-            cls.owner_extra_boards.append(board)
 
     @classmethod
     def _create_memberships(cls):
         """Create memberships to define user roles on the primary board."""
-        # The owner is automatically a member with the 'Owner' role.
-        Membership.objects.create(user=cls.owner, board=cls.board, role=Membership.ROLE_OWNER)
-        # Add 'member' user to the primary board with the 'Member' role.
-        Membership.objects.create(user=cls.member, board=cls.board, role=Membership.ROLE_MEMBER)
-        Membership.objects.create(user=cls.board_admin, board=cls.board, role=Membership.ROLE_ADMIN)
-        Membership.objects.create(user=cls.board_viewer, board=cls.board, role=Membership.ROLE_VIEWER)
+        (
+            cls.owner_membership,
+            cls.member_membership,
+            cls.admin_membership,
+            cls.viewer_membership,
+        ) = Membership.objects.bulk_create([
+            # The owner is automatically a member with the 'Owner' role.
+            Membership(user=cls.owner, board=cls.board, role=Membership.ROLE_OWNER),
+            # Add 'member' user to the primary board with the 'Member' role.
+            Membership(user=cls.member, board=cls.board, role=Membership.ROLE_MEMBER),
+            Membership(user=cls.board_admin, board=cls.board, role=Membership.ROLE_ADMIN),
+            Membership(user=cls.board_viewer, board=cls.board, role=Membership.ROLE_VIEWER),
+        ])
 
     @classmethod
     def _create_lists_and_cards(cls):
         """Create a basic structure of lists and cards within the primary board."""
-        cls.list1 = List.objects.create(board=cls.board, title='To Do', order=1)
-        cls.list2 = List.objects.create(board=cls.board, title='In Progress', order=2)
+        cls.list1, cls.list2 = List.objects.bulk_create([
+            List(board=cls.board, title='To Do', order=1),
+            List(board=cls.board, title='In Progress', order=2),
+        ])
         
-        cls.card1 = Card.objects.create(list=cls.list1, title='Card 1 in To Do', order=1)
-        cls.card2 = Card.objects.create(list=cls.list1, title='Card 2 in To Do', order=2)
-        cls.card3 = Card.objects.create(list=cls.list2, title='Card 3 in Progress', order=1)
+        cls.card1, cls.card2, cls.card3 = Card.objects.bulk_create([
+            Card(list=cls.list1, title='Card 1 in To Do', order=1),
+            Card(list=cls.list1, title='Card 2 in To Do', order=2),
+            Card(list=cls.list2, title='Card 3 in Progress', order=1),
+        ])
         
         # Add assignees to a card for testing permissions/display
         cls.card1.assignees.add(cls.owner, cls.member)
@@ -107,3 +128,19 @@ class BaseBoardTestCase(BaseTestCase):
         # It's good practice to not log in any user by default.
         # Each test method will explicitly log in the user whose perspective it is testing.
         pass
+
+
+class BoardLimitTestCase(BaseBoardTestCase):
+    """
+    BaseBoardTestCase with the owner already at MAX_BOARDS_PER_USER boards.
+    Only tests that exercise the board limit should pay for the extra boards.
+    """
+    @classmethod
+    def _create_boards(cls):
+        """Add boards up to the user limit for the owner, for testing creation limits."""
+        super()._create_boards()
+        # We already created one board for the owner, so we create MAX-1 more.
+        cls.owner_extra_boards = Board.objects.bulk_create([
+            Board(owner=cls.owner, title=f'Owner Board {i+2}', color='red')
+            for i in range(cls.max_board_per_user - 1)
+        ])
@@ -1,9 +1,10 @@
-from django.test import TestCase
+from django.test import SimpleTestCase
 from apps.boards.forms import BoardForm, ListForm, CardForm, MembershipForm
-from apps.boards.models import Board, Membership, Card, List
+from apps.boards.models import Membership, Card, List
 from apps.accounts.models import User
+from apps.boards.tests.base_test import BaseModelTestCase
 
-class BoardFormTest(TestCase):
+class BoardFormTest(SimpleTestCase):
     def test_valid_data(self):
         form = BoardForm(data={'title': 'Test Board', 'color': 'blue'})
         self.assertTrue(form.is_valid())
@@ -18,7 +19,7 @@ class BoardFormTest(TestCase):
         self.assertIn('title', form.errors)
 
 
-class ListFormTest(TestCase):
+class ListFormTest(SimpleTestCase):
     def test_valid_data(self):
         form = ListForm(data={'title': 'Test List'})
         self.assertTrue(form.is_valid())
@@ -33,11 +34,7 @@ class ListFormTest(TestCase):
         self.assertIn('title', form.errors)
 
 
-class CardFormTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user('testuser', email='test@example.com', password='password')
-        self.board = Board.objects.create(owner=self.user, title='Test Board', color='blue')
-
+class CardFormTest(BaseModelTestCase):
     def test_valid_data(self):
         form = CardForm(data={'title': 'Test Card', 'priority': 50}, board=self.board)
         self.assertTrue(form.is_valid())
@@ -52,11 +49,7 @@ class CardFormTest(TestCase):
         self.assertIn('due_date', form.errors)
 
 
-class MembershipFormTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user('testuser', email='test@example.com', password='password')
-        self.board = Board.objects.create(owner=self.user, title='Test Board', color='blue')
-
+class MembershipFormTest(BaseModelTestCase):
     def test_valid_data(self):
         new_user = User.objects.create_user('newuser', email='newuser@example.com', password='password')
         form = MembershipForm(data={'user': new_user.id, 'role': Membership.ROLE_MEMBER}, board=self.board)
@@ -1,15 +1,11 @@
-from django.test import TestCase
-from apps.accounts.models import User
-from ..models import Board, List, Card, Membership
+from unittest import skipUnless
+
+from django.db import connection
 
-class BoardModelTests(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user('testuser', email='test@example.com', password='password')
-        self.board = Board.objects.create(owner=self.user, title='Test Board', color='blue')
-        self.list = List.objects.create(board=self.board, title='Test List', order=1)
-        self.card = Card.objects.create(list=self.list, title='Test Card', order=1)
-        self.membership = Membership.objects.create(user=self.user, board=self.board, role=Membership.ROLE_OWNER)
+from ..models import Board, List, Card, Membership
+from .base_test import BaseModelTestCase
 
+class BoardModelTests(BaseModelTestCase):
     def test_board_creation(self):
         """
         Test that a Board can be created successfully.
@@ -23,10 +19,10 @@ class BoardModelTests(TestCase):
         """
         Test that a List can be created successfully.
         """
-        self.assertIsInstance(self.list, List)
-        self.assertEqual(self.list.title, 'Test List')
-        self.assertEqual(self.list.board, self.board)
-        self.assertEqual(self.list.order, 1)
+        self.assertIsInstance(self.list_obj, List)
+        self.assertEqual(self.list_obj.title, 'Test List')
+        self.assertEqual(self.list_obj.board, self.board)
+        self.assertEqual(self.list_obj.order, 1)
     
     def test_card_creation(self):
         """
@@ -34,7 +30,7 @@ class BoardModelTests(TestCase):
         """
         self.assertIsInstance(self.card, Card)
         self.assertEqual(self.card.title, 'Test Card')
-        self.assertEqual(self.card.list, self.list)
+        self.assertEqual(self.card.list, self.list_obj)
         self.assertEqual(self.card.order, 1)
     
     def test_membership_creation(self):
@@ -48,38 +44,20 @@ class BoardModelTests(TestCase):
 
 
 
-class ListModelTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user('testuser', email='test@example.com', password='password')
-        self.board = Board.objects.create(owner=self.user, title='Test Board', color='blue')
-        self.list_obj = List.objects.create(board=self.board, title='Test List', order=1)
-
-    
+class ListModelTest(BaseModelTestCase):
     def test_list_str_representation(self):
         self.assertEqual(str(self.list_obj), f'{self.list_obj.title} - {self.board.title}')
 
 
 
-class CardModelTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user('testuser', email='test@example.com', password='password')
-        self.board = Board.objects.create(owner=self.user, title='Test Board', color='blue')
-        self.list_obj = List.objects.create(board=self.board, title='Test List', order=1)
-        self.card = Card.objects.create(list=self.list_obj, title='Test Card', order=1)
-
-
+class CardModelTest(BaseModelTestCase):
     def test_card_move_to_different_list(self):
         new_list = List.objects.create(board=self.board, title='New List', order=2)
         self.card.move_to(new_list)
         self.assertEqual(self.card.list, new_list)
 
 
-class MembershipModelTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user('testuser', email='test@example.com', password='password')
-        self.board = Board.objects.create(owner=self.user, title='Test Board', color='blue')
-        self.membership = Membership.objects.create(user=self.user, board=self.board, role=Membership.ROLE_OWNER)
-
+class MembershipModelTest(BaseModelTestCase):
     def test_membership_is_owner(self):
         self.assertTrue(self.membership.is_owner())
 
@@ -95,3 +73,11 @@ class MembershipModelTest(TestCase):
         self.membership.deactivate()
         self.membership.activate()
         self.assertTrue(self.membership.is_active)
+
+    @skipUnless(connection.vendor == 'sqlite', "SQLite's planner uses a usable index even on tiny tables")
+    def test_membership_lookup_uses_index(self):
+        # The (user, board) lookup behind every permission check must search on both
+        # columns through the unique_together index, not narrow by one column and scan.
+        plan = Membership.objects.filter(board=self.board, user=self.user, is_active=True).explain()
+        self.assertIn('USING INDEX', plan)
+        self.assertIn('(user_id=? AND board_id=?)', plan)
@@ -1,13 +1,26 @@
 from django.urls import reverse
-from django.test import TestCase
+from django.views import View
 from django.contrib.auth.models import AnonymousUser
 from django.http import Http404
 from django.core.exceptions import PermissionDenied, ValidationError
 from apps.boards.tests.base_test import BaseBoardTestCase
-from apps.boards.models import Membership, Card, List, Board
-from apps.accounts.models import User
-from apps.boards.permissions import BoardObjectPermissionMixin, BoardMemberRequiredMixin, BoardAdminRequiredMixin
-from unittest.mock import Mock, patch
+from apps.boards.models import Card, List, Board
+from apps.boards.permissions import BoardObjectPermissionMixin, BoardMemberRequiredMixin, BoardAdminRequiredMixin, reserve_next_card_order
+from types import SimpleNamespace
+from unittest import skip
+from urllib.parse import urlencode
+from unittest.mock import patch
+
+
+class _ProbeBase(View):
+    """Stands in for the view behind the mixin: reaching it means access was granted."""
+    def dispatch(self, request, *args, **kwargs):
+        return 'success'
+
+
+class _ProbeView(BoardObjectPermissionMixin, _ProbeBase):
+    pass
+
 
 class TestRolePermissions(BaseBoardTestCase):
     """
@@ -16,72 +29,55 @@ class TestRolePermissions(BaseBoardTestCase):
     """
     @classmethod
     def setUpTestData(cls):
-        # Call the parent setup
-                super().setUpTestData()
-            
-                # Create an Admin user if not exists and add to main board
-                cls.admin, created = User.objects.get_or_create(
-                    username='board_admin', defaults={'email': 'admin@test.com', 'password': 'p'}
-                )
-                if created:
-                    User.objects.get(username='board_admin').set_password('p')
-                    User.objects.get(username='board_admin').save()
-                if not Membership.objects.filter(user=cls.admin, board=cls.board).exists():
-                    Membership.objects.create(user=cls.admin, board=cls.board, role=Membership.ROLE_ADMIN)
-                
-                # Create a Viewer user if not exists
-                cls.viewer, created = User.objects.get_or_create(
-                    username='board_viewer', defaults={'email': 'viewer@test.com', 'password': 'p'}
-                )
-                if created:
-                    User.objects.get(username='board_viewer').set_password('p')
-                    User.objects.get(username='board_viewer').save()
-                if not Membership.objects.filter(user=cls.viewer, board=cls.board).exists():
-                    Membership.objects.create(user=cls.viewer, board=cls.board, role=Membership.ROLE_VIEWER)
+        super().setUpTestData()
+        # BaseBoardTestCase already adds these users to the main board with their roles.
+        cls.admin = cls.board_admin
+        cls.viewer = cls.board_viewer
+
+        cls.update_board_url = reverse('boards:update_board', kwargs={'board_id': cls.board.id})
+        cls.move_card_url = reverse('boards:move_card', kwargs={
+            'board_id': cls.board.id,
+            'list_id': cls.list1.id,
+            'card_id': cls.card1.id
+        })
+        cls.remove_member_url = reverse('boards:remove_member', kwargs={
+            'board_id': cls.board.id,
+            'membership_id': cls.member_membership.id
+        })
+        cls.encoded_move_payload = urlencode({'to_list_id': cls.list2.id, 'new_index': 0})
 
     def test_board_update_permissions_by_role(self):
         """Tests who can and cannot update a board."""
-        url = reverse('boards:update_board', kwargs={'board_id': self.board.id})
+        url = self.update_board_url
         post_data = {'title': 'Updated Title', 'color': 'red'}
         
         # Owner CAN update
-        self.client.logout()
-        self.client.login(username='board_owner', password='p')
+        self.client.force_login(self.owner)
         response = self.client.post(url, post_data, HTTP_HX_REQUEST='true')
         self.assertEqual(response.status_code, 200) # Assuming HTMX response
         
         # Admin CAN update
-        self.client.logout()
-        self.client.login(username='board_admin', password='p')
+        self.client.force_login(self.admin)
         response = self.client.post(url, post_data, HTTP_HX_REQUEST='true')
         self.assertEqual(response.status_code, 200)
         
         # Member CANNOT update
-        self.client.logout()
-        self.client.login(username='board_member', password='p')
+        self.client.force_login(self.member)
         response = self.client.post(url, post_data)
         self.assertEqual(response.status_code, 403) # Forbidden
         
         # Viewer CANNOT update
-        self.client.logout()
-        self.client.login(username='board_viewer', password='p')
+        self.client.force_login(self.viewer)
         response = self.client.post(url, post_data)
         self.assertEqual(response.status_code, 403)
 
     def test_card_move_permissions_by_role(self):
         """Tests who can and cannot move cards."""
-        move_url = reverse('boards:move_card', kwargs={
-            'board_id': self.board.id,
-            'list_id': self.list1.id,
-            'card_id': self.card1.id
-        })
-        payload = {'to_list_id': self.list2.id, 'new_index': 0}
-        import urllib.parse
-        encoded_payload = urllib.parse.urlencode(payload)
+        move_url = self.move_card_url
+        encoded_payload = self.encoded_move_payload
         
         # Member CAN move cards
-        self.client.logout()
-        self.client.login(username='board_member', password='p')
+        self.client.force_login(self.member)
         response = self.client.put(
             move_url, 
             data=encoded_payload,
@@ -92,8 +88,7 @@ class TestRolePermissions(BaseBoardTestCase):
         
         # Viewer CANNOT move cards
         # We need a new mixin/logic for this, so this test will fail initially (TDD!)
-        self.client.logout()
-        self.client.login(username='board_viewer', password='p')
+        self.client.force_login(self.viewer)
         response = self.client.put(move_url, data=encoded_payload, content_type='application/x-www-form-urlencoded')
         self.assertEqual(response.status_code, 403) # This will fail until we implement the logic
         
@@ -103,21 +98,15 @@ class TestRolePermissions(BaseBoardTestCase):
         - Only Owner/Admin should be able to remove other members.
         - A Member cannot remove another member.
         """
-        # This URL does not exist yet. This test will fail with NoReverseMatch.
-        remove_member_url = reverse('boards:remove_member', kwargs={
-            'board_id': self.board.id,
-            'membership_id': self.member.memberships.get(board=self.board).id
-        })
+        remove_member_url = self.remove_member_url
         
         # A regular Member tries to remove another member -> FORBIDDEN
-        self.client.logout()
-        self.client.login(username='board_member', password='p')
+        self.client.force_login(self.member)
         response = self.client.delete(remove_member_url)
         self.assertEqual(response.status_code, 403)
         
         # An Admin CAN remove a member
-        self.client.logout()
-        self.client.login(username='board_admin', password='p')
+        self.client.force_login(self.admin)
         response = self.client.delete(remove_member_url)
         self.assertIn(response.status_code, [200, 204]) # Success
     
@@ -125,7 +114,7 @@ class TestRolePermissions(BaseBoardTestCase):
         pass
 
 
-class TestBoardObjectPermissionMixin(TestCase):
+class TestBoardObjectPermissionMixin(BaseBoardTestCase):
     """
     Comprehensive tests for the BoardObjectPermissionMixin.
     Tests authentication, authorization, error handling, and edge cases.
@@ -133,53 +122,33 @@ class TestBoardObjectPermissionMixin(TestCase):
 
     @classmethod
     def setUpTestData(cls):
-        """Create test data for BoardObjectPermissionMixin tests."""
-        # Create users
-        cls.owner = User.objects.create_user(username='owner', email='owner@test.com', password='p')
-        cls.member = User.objects.create_user(username='member', email='member@test.com', password='p')
-        cls.non_member = User.objects.create_user(username='non_member', email='nonmember@test.com', password='p')
-
-        # Create board
-        cls.board = Board.objects.create(owner=cls.owner, title='Test Board', color='blue')
+        """Reuse the shared board fixtures; the mixin tests check one list and one card."""
+        super().setUpTestData()
+        cls.list = cls.list1
+        cls.card = cls.card1
 
-        # Create memberships
-        Membership.objects.create(user=cls.owner, board=cls.board, role=Membership.ROLE_OWNER)
-        Membership.objects.create(user=cls.member, board=cls.board, role=Membership.ROLE_MEMBER)
-
-        # Create lists and cards
-        cls.list = List.objects.create(board=cls.board, title='Test List', order=1)
-        cls.card = Card.objects.create(list=cls.list, title='Test Card', order=1)
+        # Object ID for each model the mixin can check.
+        cls._MIXIN_OBJECT_IDS = {Card: cls.card.id, List: cls.list.id, Board: cls.board.id}
 
     def _create_mixin_for_model(self, model_class, id_kwarg_name):
         """Helper to create a mixin instance for testing."""
-        mixin = BoardObjectPermissionMixin()
+        mixin = _ProbeView()
         mixin.model_to_check = model_class
         mixin.id_kwarg_name = id_kwarg_name
-        mixin.kwargs = {id_kwarg_name: self._get_object_id(model_class)}
+        mixin.kwargs = {id_kwarg_name: self._MIXIN_OBJECT_IDS[model_class]}
         return mixin
 
-    def _get_object_id(self, model_class):
-        """Helper to get object ID based on model class."""
-        if model_class == Board:
-            return self.board.id
-        elif model_class == List:
-            return self.list.id
-        elif model_class == Card:
-            return self.card.id
-        return None
-
     def test_unauthenticated_user_redirected(self):
         """Test that unauthenticated users are redirected to login."""
         mixin = self._create_mixin_for_model(Card, 'card_id')
-        request = Mock()
-        request.user = AnonymousUser()
-        request.get_full_path.return_value = '/test/path/'
+        request = SimpleNamespace(user=AnonymousUser(), get_full_path=lambda: '/test/path/')
 
-        with patch('django.contrib.auth.views.redirect_to_login') as mock_redirect:
+        with patch('django.contrib.auth.views.redirect_to_login') as mock_redirect, \
+                self.assertLogs('apps.boards.permissions', level='WARNING') as logs:
             mock_redirect.return_value = 'redirect_response'
             response = mixin.dispatch(request)
 
-            # mock_logger.assert_called_once()
+            self.assertIn('Unauthenticated access attempt to _ProbeView', logs.output[0])
             mock_redirect.assert_called_once_with('/test/path/')
             self.assertEqual(response, 'redirect_response')
 
@@ -189,8 +158,7 @@ class TestBoardObjectPermissionMixin(TestCase):
         mixin.id_kwarg_name = 'test_id'
         mixin.kwargs = {'test_id': 1}
 
-        request = Mock()
-        request.user = self.owner
+        request = SimpleNamespace(user=self.owner)
 
         with self.assertRaises(ValueError) as cm:
             mixin.dispatch(request)
@@ -202,8 +170,7 @@ class TestBoardObjectPermissionMixin(TestCase):
         mixin.model_to_check = Card
         mixin.kwargs = {'card_id': 1}
 
-        request = Mock()
-        request.user = self.owner
+        request = SimpleNamespace(user=self.owner)
 
         with self.assertRaises(ValueError) as cm:
             mixin.dispatch(request)
@@ -216,8 +183,7 @@ class TestBoardObjectPermissionMixin(TestCase):
         mixin.id_kwarg_name = 'card_id'
         mixin.kwargs = {}  # Missing card_id
 
-        request = Mock()
-        request.user = self.owner
+        request = SimpleNamespace(user=self.owner)
 
         with self.assertRaises(ValueError) as cm:
             mixin.dispatch(request)
@@ -230,485 +196,88 @@ class TestBoardObjectPermissionMixin(TestCase):
         mixin.id_kwarg_name = 'card_id'
         mixin.kwargs = {'card_id': 99999}  # Non-existent ID
 
-        request = Mock()
-        request.user = self.owner
-
-        with patch('apps.boards.permissions.custom_logger'):
-            with self.assertRaises(Http404):
-                mixin.dispatch(request)
-
-    def test_board_resolution_for_card(self):
-        """Test that board is correctly resolved from Card."""
-        mixin = self._create_mixin_for_model(Card, 'card_id')
-        request = Mock()
-        request.user = self.owner
-
-        with patch('apps.boards.permissions.custom_logger'):
-            with patch('apps.boards.permissions.super') as mock_super:
-                mock_super.return_value.dispatch.return_value = 'success'
-                response = mixin.dispatch(request)
-
-                # Check that board was correctly resolved
-                self.assertEqual(mixin.board, self.board)
-                self.assertEqual(mixin.object, self.card)
-                mock_super.return_value.dispatch.assert_called_once()
-
-    def test_board_resolution_for_list(self):
-        """Test that board is correctly resolved from List."""
-        mixin = self._create_mixin_for_model(List, 'list_id')
-        request = Mock()
-        request.user = self.owner
-
-        with patch('apps.boards.permissions.custom_logger'):
-            with patch('apps.boards.permissions.super') as mock_super:
-                mock_super.return_value.dispatch.return_value = 'success'
-                response = mixin.dispatch(request)
-
-                self.assertEqual(mixin.board, self.board)
-                self.assertEqual(mixin.object, self.list)
-
-    def test_board_resolution_for_board(self):
-        """Test that board is correctly resolved from Board."""
-        mixin = self._create_mixin_for_model(Board, 'board_id')
-        request = Mock()
-        request.user = self.owner
-
-        with patch('apps.boards.permissions.custom_logger'):
-            with patch('apps.boards.permissions.super') as mock_super:
-                mock_super.return_value.dispatch.return_value = 'success'
-                response = mixin.dispatch(request)
-
-                self.assertEqual(mixin.board, self.board)
-                self.assertEqual(mixin.object, self.board)
-
-    def test_non_member_denied_access(self):
-        """Test that non-members are denied access."""
-        mixin = self._create_mixin_for_model(Card, 'card_id')
-        request = Mock()
-        request.user = self.non_member
-
-        self.client.force_login(self.non_member)
-        with patch('apps.boards.permissions.custom_logger'):
-            with self.assertRaises(PermissionDenied) as cm:
-                mixin.dispatch(request)
-
-            self.assertIn("must be a member of this board", str(cm.exception))
-
-    def test_member_granted_access(self):
-        """Test that board members are granted access."""
-        mixin = self._create_mixin_for_model(Card, 'card_id')
-        request = Mock()
-        request.user = self.member
-
-        with patch('apps.boards.permissions.custom_logger'):
-            with patch('apps.boards.permissions.super') as mock_super:
-                mock_super.return_value.dispatch.return_value = 'success'
-                response = mixin.dispatch(request)
-
-                self.assertEqual(response, 'success')
-                self.assertEqual(mixin.board, self.board)
-                self.assertEqual(mixin.object, self.card)
-
-    def test_owner_granted_access(self):
-        """Test that board owners are granted access."""
-        mixin = self._create_mixin_for_model(Card, 'card_id')
-        request = Mock()
-        request.user = self.owner
-
-        with patch('apps.boards.permissions.custom_logger'):
-            with patch('apps.boards.permissions.super') as mock_super:
-                mock_super.return_value.dispatch.return_value = 'success'
-                response = mixin.dispatch(request)
-
-                self.assertEqual(response, 'success')
-
-    def test_optimized_queries_for_card(self):
-        """Test that optimized queries are used for Card objects."""
-        mixin = self._create_mixin_for_model(Card, 'card_id')
-        request = Mock()
-        request.user = self.owner
-
-        with patch('apps.boards.permissions.custom_logger'):
-            with patch('apps.boards.permissions.super') as mock_super:
-                with patch('apps.boards.permissions.get_object_or_404') as mock_get:
-                    mock_get.return_value = self.card
-                    mock_super.return_value.dispatch.return_value = 'success'
-
-                    mixin.dispatch(request)
-
-                    # Verify select_related was called for Card (check SQL JOINs)
-                    mock_get.assert_called_once()
-                    called_qs = mock_get.call_args[0][0]
-                    sql = str(called_qs.query)
-                    self.assertIn('INNER JOIN "boards_list"', sql)      # From select_related('list__board__owner')
-                    self.assertIn('INNER JOIN "boards_board"', sql)
-                    self.assertIn('INNER JOIN "accounts_user"', sql)
-                    # Removed: self.assertIn('prefetch_related', sql)  # Not in main SQL
-
-    def test_optimized_queries_for_list(self):
-        """Test that optimized queries are used for List objects."""
-        mixin = self._create_mixin_for_model(List, 'list_id')
-        request = Mock()
-        request.user = self.owner
-
-        with patch('apps.boards.permissions.custom_logger'):
-            with patch('apps.boards.permissions.super') as mock_super:
-                with patch('apps.boards.permissions.get_object_or_404') as mock_get:
-                    mock_get.return_value = self.list
-                    mock_super.return_value.dispatch.return_value = 'success'
-
-                    mixin.dispatch(request)
-
-                    # Verify select_related was called for List (check SQL JOINs)
-                    mock_get.assert_called_once()
-                    called_qs = mock_get.call_args[0][0]
-                    sql = str(called_qs.query)
-                    self.assertIn('INNER JOIN "boards_board"', sql)     # From select_related('board__owner')
-                    self.assertIn('INNER JOIN "accounts_user"', sql)
-                    # Removed: expected_qs line (unused now)
-
-    def test_optimized_queries_for_board(self):
-        """Test that optimized queries are used for Board objects."""
-        mixin = self._create_mixin_for_model(Board, 'board_id')
-        request = Mock()
-        request.user = self.owner
-
-        with patch('apps.boards.permissions.custom_logger'):
-            with patch('apps.boards.permissions.super') as mock_super:
-                with patch('apps.boards.permissions.get_object_or_404') as mock_get:
-                    mock_get.return_value = self.board
-                    mock_super.return_value.dispatch.return_value = 'success'
-
-                    mixin.dispatch(request)
-
-                    # Verify select_related was called for Board (check SQL JOINs)
-                    mock_get.assert_called_once()
-                    called_qs = mock_get.call_args[0][0]
-                    sql = str(called_qs.query)
-                    self.assertIn('INNER JOIN "accounts_user"', sql)    # From select_related('owner')
-                    # Removed: expected_qs line (unused now)
-
-    def test_non_member_denied_access(self):
-        """Test that non-members are denied access."""
-        mixin = self._create_mixin_for_model(Card, 'card_id')
-        request = Mock()
-        request.user = self.non_member
-
-        self.client.force_login(self.non_member)
-        with patch('apps.boards.permissions.custom_logger'):
-            with self.assertRaises(PermissionDenied) as cm:
-                mixin.dispatch(request)
-
-            self.assertIn("must be a member of this board", str(cm.exception))
-
-    def test_member_granted_access(self):
-        """Test that board members are granted access."""
-        mixin = self._create_mixin_for_model(Card, 'card_id')
-        request = Mock()
-        request.user = self.member
-
-        with patch('apps.boards.permissions.custom_logger'):
-            with patch('apps.boards.permissions.super') as mock_super:
-                mock_super.return_value.dispatch.return_value = 'success'
-                response = mixin.dispatch(request)
-
-                self.assertEqual(response, 'success')
-                self.assertEqual(mixin.board, self.board)
-                self.assertEqual(mixin.object, self.card)
+        request = SimpleNamespace(user=self.owner)
 
-    def test_owner_granted_access(self):
-        """Test that board owners are granted access."""
-        mixin = self._create_mixin_for_model(Card, 'card_id')
-        request = Mock()
-        request.user = self.owner
-
-        with patch('apps.boards.permissions.custom_logger'):
-            with patch('apps.boards.permissions.super') as mock_super:
-                mock_super.return_value.dispatch.return_value = 'success'
-                response = mixin.dispatch(request)
-
-                self.assertEqual(response, 'success')
-
-    def test_optimized_queries_for_card(self):
-        """Test that optimized queries are used for Card objects."""
-        mixin = self._create_mixin_for_model(Card, 'card_id')
-        request = Mock()
-        request.user = self.owner
-
-        with patch('apps.boards.permissions.custom_logger'):
-            with patch('apps.boards.permissions.super') as mock_super:
-                with patch('apps.boards.permissions.get_object_or_404') as mock_get:
-                    mock_get.return_value = self.card
-                    mock_super.return_value.dispatch.return_value = 'success'
-
-                    mixin.dispatch(request)
-
-                    # Verify select_related was called for Card (check SQL JOINs)
-                    mock_get.assert_called_once()
-                    called_qs = mock_get.call_args[0][0]
-                    sql = str(called_qs.query)
-                    self.assertIn('INNER JOIN "boards_list"', sql)      # From select_related('list__board__owner')
-                    self.assertIn('INNER JOIN "boards_board"', sql)
-                    self.assertIn('INNER JOIN "accounts_user"', sql)
-                    # Removed: self.assertIn('prefetch_related', sql)  # Not in main SQL
-
-    def test_optimized_queries_for_list(self):
-        """Test that optimized queries are used for List objects."""
-        mixin = self._create_mixin_for_model(List, 'list_id')
-        request = Mock()
-        request.user = self.owner
-
-        with patch('apps.boards.permissions.custom_logger'):
-            with patch('apps.boards.permissions.super') as mock_super:
-                with patch('apps.boards.permissions.get_object_or_404') as mock_get:
-                    mock_get.return_value = self.list
-                    mock_super.return_value.dispatch.return_value = 'success'
-
-                    mixin.dispatch(request)
-
-                    # Verify select_related was called for List (check SQL JOINs)
-                    mock_get.assert_called_once()
-                    called_qs = mock_get.call_args[0][0]
-                    sql = str(called_qs.query)
-                    self.assertIn('INNER JOIN "boards_board"', sql)     # From select_related('board__owner')
-                    self.assertIn('INNER JOIN "accounts_user"', sql)
-                    # Removed: expected_qs line (unused now)
-
-    def test_optimized_queries_for_board(self):
-        """Test that optimized queries are used for Board objects."""
-        mixin = self._create_mixin_for_model(Board, 'board_id')
-        request = Mock()
-        request.user = self.owner
-
-        with patch('apps.boards.permissions.custom_logger'):
-            with patch('apps.boards.permissions.super') as mock_super:
-                with patch('apps.boards.permissions.get_object_or_404') as mock_get:
-                    mock_get.return_value = self.board
-                    mock_super.return_value.dispatch.return_value = 'success'
-
-                    mixin.dispatch(request)
-
-                    # Verify select_related was called for Board (check SQL JOINs)
-                    mock_get.assert_called_once()
-                    called_qs = mock_get.call_args[0][0]
-                    sql = str(called_qs.query)
-                    self.assertIn('INNER JOIN "accounts_user"', sql)    # From select_related('owner')
-                    # Removed: expected_qs line (unused now)
-
-    def test_non_member_denied_access(self):
-        """Test that non-members are denied access."""
-        mixin = self._create_mixin_for_model(Card, 'card_id')
-        request = Mock()
-        request.user = self.non_member
-
-        self.client.force_login(self.non_member)
-        with patch('apps.boards.permissions.custom_logger'):
-            with self.assertRaises(PermissionDenied) as cm:
-                mixin.dispatch(request)
-
-            self.assertIn("must be a member of this board", str(cm.exception))
-
-    def test_member_granted_access(self):
-        """Test that board members are granted access."""
-        mixin = self._create_mixin_for_model(Card, 'card_id')
-        request = Mock()
-        request.user = self.member
+        with self.assertRaises(Http404):
+            mixin.dispatch(request)
 
-        with patch('apps.boards.permissions.custom_logger'):
-            with patch('apps.boards.permissions.super') as mock_super:
-                mock_super.return_value.dispatch.return_value = 'success'
-                response = mixin.dispatch(request)
+    def test_board_resolution(self):
+        """Test that the board is correctly resolved from each supported model, in one JOINed query."""
+        cases = [
+            # Card/list/board/owner in one query, plus the assignees prefetch.
+            (Card, 'card_id', self.card, 2),
+            (List, 'list_id', self.list, 1),
+            (Board, 'board_id', self.board, 1),
+        ]
+        for model_class, id_kwarg_name, expected_object, expected_queries in cases:
+            with self.subTest(model=model_class.__name__):
+                mixin = self._create_mixin_for_model(model_class, id_kwarg_name)
+                request = SimpleNamespace(user=self.owner)
+
+                with self.assertNumQueries(expected_queries):
+                    response = mixin.dispatch(request)
 
                 self.assertEqual(response, 'success')
                 self.assertEqual(mixin.board, self.board)
-                self.assertEqual(mixin.object, self.card)
-
-    def test_owner_granted_access(self):
-        """Test that board owners are granted access."""
-        mixin = self._create_mixin_for_model(Card, 'card_id')
-        request = Mock()
-        request.user = self.owner
-
-        with patch('apps.boards.permissions.custom_logger'):
-            with patch('apps.boards.permissions.super') as mock_super:
-                mock_super.return_value.dispatch.return_value = 'success'
-                response = mixin.dispatch(request)
-
-                self.assertEqual(response, 'success')
-
-    def test_optimized_queries_for_card(self):
-        """Test that optimized queries are used for Card objects."""
-        mixin = self._create_mixin_for_model(Card, 'card_id')
-        request = Mock()
-        request.user = self.owner
-
-        with patch('apps.boards.permissions.custom_logger'):
-            with patch('apps.boards.permissions.super') as mock_super:
-                with patch('apps.boards.permissions.get_object_or_404') as mock_get:
-                    mock_get.return_value = self.card
-                    mock_super.return_value.dispatch.return_value = 'success'
-
-                    mixin.dispatch(request)
-
-                    # Verify select_related was called for Card (check SQL JOINs)
-                    mock_get.assert_called_once()
-                    called_qs = mock_get.call_args[0][0]
-                    sql = str(called_qs.query)
-                    self.assertIn('INNER JOIN "boards_list"', sql)      # From select_related('list__board__owner')
-                    self.assertIn('INNER JOIN "boards_board"', sql)
-                    self.assertIn('INNER JOIN "accounts_user"', sql)
-                    # Removed: self.assertIn('prefetch_related', sql)  # Not in main SQL
-
-    def test_optimized_queries_for_list(self):
-        """Test that optimized queries are used for List objects."""
-        mixin = self._create_mixin_for_model(List, 'list_id')
-        request = Mock()
-        request.user = self.owner
-
-        with patch('apps.boards.permissions.custom_logger'):
-            with patch('apps.boards.permissions.super') as mock_super:
-                with patch('apps.boards.permissions.get_object_or_404') as mock_get:
-                    mock_get.return_value = self.list
-                    mock_super.return_value.dispatch.return_value = 'success'
-
-                    mixin.dispatch(request)
-
-                    # Verify select_related was called for List (check SQL JOINs)
-                    mock_get.assert_called_once()
-                    called_qs = mock_get.call_args[0][0]
-                    sql = str(called_qs.query)
-                    self.assertIn('INNER JOIN "boards_board"', sql)     # From select_related('board__owner')
-                    self.assertIn('INNER JOIN "accounts_user"', sql)
-                    # Removed: expected_qs line (unused now)
-
-    def test_optimized_queries_for_board(self):
-        """Test that optimized queries are used for Board objects."""
-        mixin = self._create_mixin_for_model(Board, 'board_id')
-        request = Mock()
-        request.user = self.owner
-
-        with patch('apps.boards.permissions.custom_logger'):
-            with patch('apps.boards.permissions.super') as mock_super:
-                with patch('apps.boards.permissions.get_object_or_404') as mock_get:
-                    mock_get.return_value = self.board
-                    mock_super.return_value.dispatch.return_value = 'success'
-
-                    mixin.dispatch(request)
-
-                    # Verify select_related was called for Board (check SQL JOINs)
-                    mock_get.assert_called_once()
-                    called_qs = mock_get.call_args[0][0]
-                    sql = str(called_qs.query)
-                    self.assertIn('INNER JOIN "accounts_user"', sql)    # From select_related('owner')
-                    # Removed: expected_qs line (unused now)
+                self.assertEqual(mixin.object, expected_object)
 
     def test_non_member_denied_access(self):
         """Test that non-members are denied access."""
         mixin = self._create_mixin_for_model(Card, 'card_id')
-        request = Mock()
-        request.user = self.non_member
+        request = SimpleNamespace(user=self.non_member)
 
-        self.client.force_login(self.non_member)
-        with patch('apps.boards.permissions.custom_logger'):
-            with self.assertRaises(PermissionDenied) as cm:
-                mixin.dispatch(request)
+        with self.assertRaises(PermissionDenied) as cm:
+            mixin.dispatch(request)
 
-            self.assertIn("must be a member of this board", str(cm.exception))
+        self.assertIn("must be a member of this board", str(cm.exception))
 
     def test_member_granted_access(self):
         """Test that board members are granted access."""
         mixin = self._create_mixin_for_model(Card, 'card_id')
-        request = Mock()
-        request.user = self.member
+        request = SimpleNamespace(user=self.member)
 
-        with patch('apps.boards.permissions.custom_logger'):
-            with patch('apps.boards.permissions.super') as mock_super:
-                mock_super.return_value.dispatch.return_value = 'success'
-                response = mixin.dispatch(request)
+        response = mixin.dispatch(request)
 
-                self.assertEqual(response, 'success')
-                self.assertEqual(mixin.board, self.board)
-                self.assertEqual(mixin.object, self.card)
+        self.assertEqual(response, 'success')
+        self.assertEqual(mixin.board, self.board)
+        self.assertEqual(mixin.object, self.card)
 
     def test_owner_granted_access(self):
         """Test that board owners are granted access."""
         mixin = self._create_mixin_for_model(Card, 'card_id')
-        request = Mock()
-        request.user = self.owner
-
-        with patch('apps.boards.permissions.custom_logger'):
-            with patch('apps.boards.permissions.super') as mock_super:
-                mock_super.return_value.dispatch.return_value = 'success'
-                response = mixin.dispatch(request)
-
-                self.assertEqual(response, 'success')
-
-    def test_optimized_queries_for_card(self):
-        """Test that optimized queries are used for Card objects."""
-        mixin = self._create_mixin_for_model(Card, 'card_id')
-        request = Mock()
-        request.user = self.owner
-
-        with patch('apps.boards.permissions.custom_logger'):
-            with patch('apps.boards.permissions.super') as mock_super:
-                with patch('apps.boards.permissions.get_object_or_404') as mock_get:
-                    mock_get.return_value = self.card
-                    mock_super.return_value.dispatch.return_value = 'success'
-
-                    mixin.dispatch(request)
-
-                    # Verify select_related was called for Card (check SQL JOINs)
-                    mock_get.assert_called_once()
-                    called_qs = mock_get.call_args[0][0]
-                    sql = str(called_qs.query)
-                    self.assertIn('INNER JOIN "boards_list"', sql)      # From select_related('list__board__owner')
-                    self.assertIn('INNER JOIN "boards_board"', sql)
-                    self.assertIn('INNER JOIN "accounts_user"', sql)
-                    # Removed: self.assertIn('prefetch_related', sql)  # Not in main SQL
-
-    def test_optimized_queries_for_list(self):
-        """Test that optimized queries are used for List objects."""
-        mixin = self._create_mixin_for_model(List, 'list_id')
-        request = Mock()
-        request.user = self.owner
-
-        with patch('apps.boards.permissions.custom_logger'):
-            with patch('apps.boards.permissions.super') as mock_super:
-                with patch('apps.boards.permissions.get_object_or_404') as mock_get:
-                    mock_get.return_value = self.list
-                    mock_super.return_value.dispatch.return_value = 'success'
+        request = SimpleNamespace(user=self.owner)
+
+        response = mixin.dispatch(request)
+
+        self.assertEqual(response, 'success')
+
+    def test_optimized_queries(self):
+        """Test that each model is fetched with select_related JOINs up to the board owner."""
+        cases = [
+            # From select_related('list__board__owner')
+            (Card, 'card_id', self.card, ['"boards_list"', '"boards_board"', '"accounts_user"']),
+            # From select_related('board__owner')
+            (List, 'list_id', self.list, ['"boards_board"', '"accounts_user"']),
+            # From select_related('owner')
+            (Board, 'board_id', self.board, ['"accounts_user"']),
+        ]
+        request = SimpleNamespace(user=self.owner)
+
+        with patch('apps.boards.permissions.get_object_or_404') as mock_get:
+            for model_class, id_kwarg_name, obj, joined_tables in cases:
+                with self.subTest(model=model_class.__name__):
+                    mock_get.reset_mock()
+                    mock_get.return_value = obj
+                    mixin = self._create_mixin_for_model(model_class, id_kwarg_name)
 
                     mixin.dispatch(request)
 
-                    # Verify select_related was called for List (check SQL JOINs)
                     mock_get.assert_called_once()
-                    called_qs = mock_get.call_args[0][0]
-                    sql = str(called_qs.query)
-                    self.assertIn('INNER JOIN "boards_board"', sql)     # From select_related('board__owner')
-                    self.assertIn('INNER JOIN "accounts_user"', sql)
-                    # Removed: expected_qs line (unused now)
-
-    def test_optimized_queries_for_board(self):
-        """Test that optimized queries are used for Board objects."""
-        mixin = self._create_mixin_for_model(Board, 'board_id')
-        request = Mock()
-        request.user = self.owner
-
-        with patch('apps.boards.permissions.custom_logger'):
-            with patch('apps.boards.permissions.super') as mock_super:
-                with patch('apps.boards.permissions.get_object_or_404') as mock_get:
-                    mock_get.return_value = self.board
-                    mock_super.return_value.dispatch.return_value = 'success'
-
-                    mixin.dispatch(request)
-
-                    # Verify select_related was called for Board (check SQL JOINs)
-                    mock_get.assert_called_once()
-                    called_qs = mock_get.call_args[0][0]
-                    sql = str(called_qs.query)
-                    self.assertIn('INNER JOIN "accounts_user"', sql)    # From select_related('owner')
-                    # Removed: expected_qs line (unused now)
+                    sql = str(mock_get.call_args[0][0].query)
+                    for table in joined_tables:
+                        self.assertIn(f'INNER JOIN {table}', sql)
 
+    @skip("TDD placeholder: the nested specs are not implemented yet")
     def test_future_features(self):
         """
         Tests for upcoming features that are not yet implemented.
@@ -764,3 +333,15 @@ class TestBoardObjectPermissionMixin(TestCase):
             """TDD: Test that only admins can invite new members."""
             # This feature doesn't exist yet - will fail until implemented
             pass
+
+
+class TestReserveNextCardOrder(BaseBoardTestCase):
+    """
+    Tests for reserve_next_card_order.
+    """
+    def test_appends_after_existing_cards(self):
+        self.assertEqual(reserve_next_card_order(self.list1.id), 3)
+
+    def test_empty_list_starts_at_one(self):
+        empty_list = List.objects.create(board=self.board, title='Empty', order=3)
+        self.assertEqual(reserve_next_card_order(empty_list.id), 1)
@@ -0,0 +1,97 @@
+from django.core.exceptions import PermissionDenied
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.views import View
+
+from apps.boards.models import Card
+from apps.boards.permissions import (
+    BoardAdminRequiredMixin,
+    BoardMemberRequiredMixin,
+    BoardObjectPermissionMixin,
+    get_board_lists,
+    get_user_boards,
+)
+from apps.boards.tests.base_test import BaseBoardTestCase
+
+
+class _OkView(View):
+    def get(self, request, *args, **kwargs):
+        return HttpResponse("ok")
+
+
+class _MemberView(BoardMemberRequiredMixin, _OkView):
+    pass
+
+
+class _AdminView(BoardAdminRequiredMixin, _OkView):
+    pass
+
+
+class _CardView(BoardObjectPermissionMixin, _OkView):
+    model_to_check = Card
+    id_kwarg_name = 'card_id'
+
+
+class TestPermissionQueryCounts(BaseBoardTestCase):
+    """
+    Guards against query-count regressions in the board permission helpers and mixins.
+    """
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def _get(self, view_class, user, **kwargs):
+        request = self.factory.get('/')
+        request.user = user
+        return view_class.as_view()(request, **kwargs)
+
+    def test_get_user_boards_query_count(self):
+        # Boards + one prefetch for the active memberships.
+        with self.assertNumQueries(2):
+            list(get_user_boards(self.member))
+
+    def test_get_board_lists_query_count(self):
+        # Lists + prefetched cards + prefetched assignees.
+        with self.assertNumQueries(3):
+            list(get_board_lists(self.board))
+
+    def test_member_mixin_query_count(self):
+        with self.assertNumQueries(1):
+            response = self._get(_MemberView, self.member, board_id=self.board.id)
+        self.assertEqual(response.status_code, 200)
+
+    def test_role_lookup_cached_per_request(self):
+        # A second membership check in the same request reuses the memoized row.
+        request = self.factory.get('/')
+        request.user = self.member
+        with self.assertNumQueries(1):
+            first = _MemberView.as_view()(request, board_id=self.board.id)
+            second = _MemberView.as_view()(request, board_id=self.board.id)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 200)
+
+    def test_admin_mixin_query_count(self):
+        with self.assertNumQueries(1):
+            response = self._get(_AdminView, self.board_admin, board_id=self.board.id)
+        self.assertEqual(response.status_code, 200)
+
+    def test_owner_admin_mixin_query_count(self):
+        with self.assertNumQueries(1):
+            response = self._get(_AdminView, self.owner, board_id=self.board.id)
+        self.assertEqual(response.status_code, 200)
+
+    def test_member_denied_admin_access_query_count(self):
+        # The role comes back with the board, so the denial needs no second lookup.
+        with self.assertNumQueries(1):
+            with self.assertRaises(PermissionDenied):
+                self._get(_AdminView, self.member, board_id=self.board.id)
+
+    def test_viewer_denied_admin_access_query_count(self):
+        with self.assertNumQueries(1):
+            with self.assertRaises(PermissionDenied):
+                self._get(_AdminView, self.board_viewer, board_id=self.board.id)
+
+    def test_object_permission_mixin_query_count(self):
+        # Card (with its membership flag) + prefetched assignees.
+        with self.assertNumQueries(2):
+            response = self._get(_CardView, self.member, card_id=self.card1.id)
+        self.assertEqual(response.status_code, 200)
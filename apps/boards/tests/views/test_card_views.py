@@ -19,11 +19,13 @@ class TestCardDetailView(BaseBoardTestCase):
     Tests for the HTMXCardDetailView.
     URL: /boards/<board_id>/lists/<list_id>/cards/<card_id>/
     """
-    def setUp(self):
-        self.url = reverse('boards:card_detail', kwargs={
-            'board_id': self.board.id,
-            'list_id': self.list1.id,
-            'card_id': self.card1.id
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse('boards:card_detail', kwargs={
+            'board_id': cls.board.id,
+            'list_id': cls.list1.id,
+            'card_id': cls.card1.id
         })
 
     # --- Approach 2: Authorized Access ---
@@ -50,8 +52,10 @@ class TestCardCreateView(BaseBoardTestCase):
     Tests for the HTMXCardCreateView.
     URL: /boards/<board_id>/lists/<list_id>/cards/create/
     """
-    def setUp(self):
-        self.url = reverse('boards:create_card', kwargs={'board_id': self.board.id, 'list_id': self.list1.id})
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse('boards:create_card', kwargs={'board_id': cls.board.id, 'list_id': cls.list1.id})
 
     # --- Approach 2: Authorized Access ---
     def test_member_can_create_card(self):
@@ -90,11 +94,13 @@ class TestCardUpdateView(BaseBoardTestCase):
     Tests for the HTMXCardUpdateView.
     URL: /boards/<board_id>/lists/<list_id>/cards/<card_id>/update/
     """
-    def setUp(self):
-        self.url = reverse('boards:card_update', kwargs={
-            'board_id': self.board.id,
-            'list_id': self.card1.list.id,
-            'card_id': self.card1.id
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse('boards:card_update', kwargs={
+            'board_id': cls.board.id,
+            'list_id': cls.card1.list_id,
+            'card_id': cls.card1.id
         })
 
     # --- Approach 2: Authorized Access ---
@@ -130,13 +136,16 @@ class TestCardDeleteView(BaseBoardTestCase):
     Tests for the HTMXCardDeleteView.
     URL: /boards/<board_id>/lists/<list_id>/cards/<card_id>/delete/
     """
-    def setUp(self):
-        # Create a disposable card for deletion tests
-        self.card_to_delete = Card.objects.create(list=self.list1, order=99, title='Card to Delete')
-        self.url = reverse('boards:card_delete', kwargs={
-            'board_id': self.board.id,
-            'list_id': self.list1.id,
-            'card_id': self.card_to_delete.id
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Create a disposable card for deletion tests. It is created once per class:
+        # each test runs in a transaction that is rolled back, restoring a deleted card.
+        cls.card_to_delete = Card.objects.create(list=cls.list1, order=99, title='Card to Delete')
+        cls.url = reverse('boards:card_delete', kwargs={
+            'board_id': cls.board.id,
+            'list_id': cls.list1.id,
+            'card_id': cls.card_to_delete.id
         })
         
     # --- Approach 2: Authorized Access ---
@@ -1,18 +1,20 @@
 import json
+from django.test import RequestFactory
 from django.urls import reverse
 from apps.boards.models import List, Card
+from apps.boards.views import HTMXListDetailView
 from apps.boards.tests.base_test import BaseBoardTestCase
 
-from custom_tools.logger import custom_logger
-
 
 class TestListCreateView(BaseBoardTestCase):
     """
     Tests for the HTMXListCreateView.
     URL: /boards/<board_id>/lists/create/
     """
-    def setUp(self):
-        self.url = reverse('boards:create_list', kwargs={'board_id': self.board.id})
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse('boards:create_list', kwargs={'board_id': cls.board.id})
 
     # --- Approach 1: Application Settings ---
     # Note: Currently no specific settings like MAX_LISTS_PER_BOARD are implemented.
@@ -21,36 +23,38 @@ class TestListCreateView(BaseBoardTestCase):
     # --- Approach 2: Authorized Access ---
     def test_member_can_get_create_list_form(self):
         """Tests if an authorized member can retrieve the create list form."""
-        self.client.login(username='board_member', password='p')
+        self.client.force_login(self.member)
         response = self.client.get(self.url, HTTP_HX_REQUEST='true')
         
         # Behavior check: The request should succeed and contain form elements.
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, '<form')
-        self.assertContains(response, 'name="title"')
+        self.assertRegex(response.content.decode(), r'<form[^>]*>[\s\S]*name="title"')
 
     def test_member_can_create_a_list(self):
         """Tests successful list creation by an authorized member."""
-        self.client.login(username='board_member', password='p')
-        list_count_before = List.objects.filter(board=self.board).count()
+        self.client.force_login(self.member)
+        ids_before = set(List.objects.filter(board=self.board).values_list('id', flat=True))
         post_data = {'title': 'QA Testing'}
 
-        response = self.client.post(self.url, post_data, HTTP_HX_REQUEST='true')
+        # Session + user + membership/board + max order + insert.
+        with self.assertNumQueries(5):
+            response = self.client.post(self.url, post_data, HTTP_HX_REQUEST='true')
 
-        list_count_after = List.objects.filter(board=self.board).count()
+        new_titles = list(
+            List.objects.filter(board=self.board).exclude(id__in=ids_before).values_list('title', flat=True)
+        )
 
         # Behavior check:
         # 1. The request was successful.
         self.assertEqual(response.status_code, 200)
-        # 2. A new list was created in the database.
-        self.assertEqual(list_count_after, list_count_before + 1)
-        self.assertTrue(List.objects.filter(title='QA Testing', board=self.board).exists())
+        # 2. Exactly one new list, the posted one, was created in the database.
+        self.assertEqual(new_titles, ['QA Testing'])
         # 3. The HTMX response contains the correct trigger.
         self.assertIn('listCreated', response.headers.get('HX-Trigger', ''))
 
     def test_list_creation_fails_with_invalid_data(self):
         """Tests that creating a list with an invalid (empty) title fails."""
-        self.client.login(username='board_owner', password='p')
+        self.client.force_login(self.owner)
         post_data = {'title': ''} # Invalid data
 
         response = self.client.post(self.url, post_data, HTTP_HX_REQUEST='true')
@@ -67,20 +71,14 @@ class TestListCreateView(BaseBoardTestCase):
         Tests that a non-member of the board receives a 404 Not Found for prevent to leack private data.
         This confirms our custom permission logic is working.
         """
-        self.client.login(username='non_member', password='p')
+        self.client.force_login(self.non_member)
         post_data = {'title': 'Should Not Be Created'}
-        
-        # The URL points to a board the non_member does not have access to.
-        url = reverse('boards:create_list', kwargs={'board_id': self.board.id})
-        
-        response_get = self.client.get(url, HTTP_HX_REQUEST='true')
-        response_post = self.client.post(url, post_data, HTTP_HX_REQUEST='true')
 
-        self.assertEqual(response_get.status_code, 404)
-        self.assertEqual(response_post.status_code, 404)
-        
-        # Verify no list was created
-        self.assertFalse(List.objects.filter(title='Should Not Be Created').exists())
+        # GET and POST share the same dispatch() permission check, so POST covers both.
+        # A 404 from dispatch() means form_valid() never ran, so no list can exist.
+        response = self.client.post(self.url, post_data, HTTP_HX_REQUEST='true')
+
+        self.assertEqual(response.status_code, 404)
     
 
     def test_anonymous_user_cannot_create_list(self):
@@ -97,32 +95,32 @@ class TestListUpdateView(BaseBoardTestCase):
     Tests for the HTMXListUpdateView.
     URL: /boards/<board_id>/lists/<list_id>/update/
     """
-    def setUp(self):
-        self.url = reverse('boards:update_list', kwargs={'board_id': self.board.id, 'list_id': self.list1.id})
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse('boards:update_list', kwargs={'board_id': cls.board.id, 'list_id': cls.list1.id})
     
     # --- Approach 2: Authorized Access ---
     def test_member_can_update_list_title(self):
         """Tests successful list title update by an authorized member."""
-        self.client.login(username='board_member', password='p')
+        self.client.force_login(self.member)
         updated_title = 'Updated To Do'
         post_data = {'title': updated_title}
         
         response = self.client.post(self.url, post_data, HTTP_HX_REQUEST='true')
 
-        self.list1.refresh_from_db() # Refresh object from DB to get the latest data
-
         # Behavior check:
         # 1. The request was successful.
         self.assertEqual(response.status_code, 200)
-        # 2. The title was updated in the database.
-        self.assertEqual(self.list1.title, updated_title)
+        # 2. The title was updated in the database (read back as a single column).
+        self.assertEqual(List.objects.values_list('title', flat=True).get(pk=self.list1.pk), updated_title)
         # 3. The HTMX response has the correct trigger.
         self.assertIn('listUpdated', response.headers.get('HX-Trigger', ''))
 
     # --- Approach 3: Unauthorized Access ---
     def test_non_member_cannot_update_list(self):
         """Tests that a non-member cannot update a list in a board they don't belong to."""
-        self.client.login(username='non_member', password='p')
+        self.client.force_login(self.non_member)
         post_data = {'title': 'Should Not Update'}
         
         response = self.client.post(self.url, post_data, HTTP_HX_REQUEST='true')
@@ -136,16 +134,18 @@ class TestListDeleteView(BaseBoardTestCase):
     Tests for the HTMXListDeleteView.
     URL: /boards/<board_id>/lists/<list_id>/delete/
     """
-    def setUp(self):
-        # Create a new, disposable list for each delete test to ensure isolation.
-        self.list_to_delete = List.objects.create(board=self.board, title='To Be Deleted', order=99)
-        Card.objects.create(list=self.list_to_delete, title='Card in deleted list')
-        self.url = reverse('boards:delete_list', kwargs={'board_id': self.board.id, 'list_id': self.list_to_delete.id})
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # A disposable list for the delete tests; each test's rollback restores it.
+        cls.list_to_delete = List.objects.create(board=cls.board, title='To Be Deleted', order=99)
+        Card.objects.create(list=cls.list_to_delete, title='Card in deleted list')
+        cls.url = reverse('boards:delete_list', kwargs={'board_id': cls.board.id, 'list_id': cls.list_to_delete.id})
     
     # --- Approach 2: Authorized Access ---
     def test_member_can_delete_list(self):
         """Tests successful list deletion by an authorized member."""
-        self.client.login(username='board_member', password='p')
+        self.client.force_login(self.member)
         
         # Verify that the list and its card exist before deletion
         list_id = self.list_to_delete.id
@@ -169,7 +169,7 @@ class TestListDeleteView(BaseBoardTestCase):
         Tests that a non-member cannot delete a list.
         A non-member is a user that logged-in but does not have right access to delete object.
         """
-        self.client.login(username='non_member', password='p')
+        self.client.force_login(self.non_member)
         response = self.client.delete(self.url, HTTP_HX_REQUEST='true')
         
         # Behavior check: Denied with 404.
@@ -183,9 +183,11 @@ class TestListDetailView(BaseBoardTestCase):
     Tests for the HTMXListDetailView.
     URL: /boards/<board_id>/lists/<list_id>/
     """
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up the URL for the list detail endpoint."""
-        self.url = reverse('boards:list_detail', kwargs={'board_id': self.board.id, 'list_id': self.list1.id})
+        super().setUpTestData()
+        cls.url = reverse('boards:list_detail', kwargs={'board_id': cls.board.id, 'list_id': cls.list1.id})
 
     # --- Approach 2: Authorized Access ---
     def test_member_can_view_list_details(self):
@@ -193,10 +195,12 @@ class TestListDetailView(BaseBoardTestCase):
         Tests if an authorized board member can successfully retrieve the list's detail partial.
         """
         # Arrange: Log in as a member of the board.
-        self.client.login(username='board_member', password='p')
+        self.client.force_login(self.member)
         
         # Act: Request the list detail partial via an HTMX request.
-        response = self.client.get(self.url, HTTP_HX_REQUEST='true')
+        # Session + user + membership/board + list.
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url, HTTP_HX_REQUEST='true')
 
         # Behavior check:
         # 1. The request should be successful.
@@ -207,19 +211,18 @@ class TestListDetailView(BaseBoardTestCase):
         """
         Verifies that the context passed to the list detail template is accurate.
         """
-        # Arrange: Log in as the owner.
-        self.client.login(username='board_owner', password='p')
+        # Arrange: Call the view directly as the owner; the TemplateResponse is
+        # returned unrendered, so the context can be checked without template IO.
+        request = RequestFactory().get(self.url)
+        request.user = self.owner
 
-        # Act: Request the list detail page.
-        response = self.client.get(self.url)
+        # Act: Membership/board + list (no session or user lookups without the client).
+        with self.assertNumQueries(2):
+            response = HTMXListDetailView.as_view()(request, board_id=self.board.id, list_id=self.list1.id)
 
-        # Assert:
-        # 1. The 'list' object in the context is the correct one.
-        #    (Note: The context variable name depends on your DetailView's 'context_object_name')
-        #    Assuming it defaults to 'list'.
-        custom_logger(f"response context: {response.context}")
-        self.assertTrue('list' in response.context)
-        self.assertEqual(response.context['list'], self.list1)
+        # Assert: The 'list' object in the context is the correct one.
+        self.assertEqual(response.context_data['list'], self.list1)
+        self.assertEqual(response.context_data['board'], self.board)
 
     # --- Approach 3: Unauthorized Access ---
     def test_anonymous_user_is_redirected(self):
@@ -235,7 +238,7 @@ class TestListDetailView(BaseBoardTestCase):
         Tests that a logged-in user who is not a member of the board receives a 404 not found error.
         """
         # Arrange: Log in as a non-member.
-        self.client.login(username='non_member', password='p')
+        self.client.force_login(self.non_member)
         
         # Act: Attempt to access the list detail endpoint.
         response = self.client.get(self.url)
@@ -1,7 +1,7 @@
 from django.test import TestCase, Client
 from django.urls import reverse
 import random
-from apps.boards.tests.base_test import BaseBoardTestCase
+from apps.boards.tests.base_test import BaseBoardTestCase, BoardLimitTestCase
 from django.conf import settings
 
 from apps.accounts.models import User
@@ -122,7 +122,7 @@ class TestBoardListView(BaseBoardTestCase):
         self.assertTrue('boards' in response.context)
         
         # 2. Check the number of boards in the context. It should be the one main board plus
-        # the extra boards we created for the limit test.
+        # any extra boards created for limit tests (none for this base class).
         total_owner_boards = 1 + len(self.owner_extra_boards)
         self.assertEqual(len(response.context['boards']), total_owner_boards)
         
@@ -292,7 +292,7 @@ class TestBoardDetailView(BaseBoardTestCase):
 
 
 #### test board create view for each user and test it for each settings and permissions.
-class TestBoardCreateView(BaseBoardTestCase):
+class TestBoardCreateView(BoardLimitTestCase):
     """
     Tests for the HTMXBoardCreateView.
     URL: /boards/create/
@@ -7,7 +7,7 @@ from django.views.decorators.http import require_http_methods
 from django.views.generic import ListView, DetailView
 from django.views.generic.edit import CreateView, UpdateView, DeleteView
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Max, Q, Prefetch
+from django.db.models import Max, Q, Prefetch, Exists, OuterRef
 from django.db import transaction
 from django.template.loader import render_to_string
 from django.conf import settings
@@ -21,7 +21,6 @@ from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
 
 from .models import Board, List, Card, Membership
-from apps.accounts.models import User
 from custom_tools.logger import custom_logger
 from .forms import *
 from colorama import Fore
@@ -30,7 +29,7 @@ from django.http import HttpResponseForbidden as HttpResponse403
 from django.core.exceptions import PermissionDenied
 
 # Fetch Helper functions to avoid repetition
-from .permissions import BoardMemberRequiredMixin, BoardAdminRequiredMixin, BoardReadWritePermissionMixin
+from .permissions import BoardMemberRequiredMixin, BoardAdminRequiredMixin, BoardReadWritePermissionMixin, can_modify_board, reserve_next_card_order
 
 
 
@@ -45,9 +44,20 @@ class BoardListView(LoginRequiredMixin, ListView):
     
     def get_queryset(self):
         """Return boards owned by or where user is active member."""
+        # EXISTS instead of joining memberships: no duplicate rows, so no DISTINCT sort.
+        active_membership = Membership.objects.filter(
+            board=OuterRef('pk'), user=self.request.user, is_active=True
+        )
         return Board.objects.filter(
-            Q(owner=self.request.user) | Q(memberships__user=self.request.user, memberships__is_active=True)
-        ).distinct()
+            Q(owner=self.request.user) | Q(Exists(active_membership))
+        ).prefetch_related(
+            # The template reads this cached list instead of one memberships query per board.
+            Prefetch(
+                'memberships',
+                queryset=Membership.objects.filter(is_active=True),
+                to_attr='active_memberships',
+            )
+        )
 
 
 class BoardDetailView(LoginRequiredMixin, BoardMemberRequiredMixin, DetailView):
@@ -95,9 +105,9 @@ class HTMXBoardCreateView(LoginRequiredMixin, CreateView):
 
     def form_valid(self, form):
         """Create board, add owner membership, return success HTML."""
-        # Check board limit
-        user_boards_count = Board.objects.filter(owner=self.request.user).count()
+        # Check board limit (count at most max_boards rows instead of all of them)
         max_boards = getattr(settings, "MAX_BOARDS_PER_USER", 10)
+        user_boards_count = Board.objects.filter(owner=self.request.user).values('pk')[:max_boards].count()
         
         if user_boards_count >= max_boards:
             form.add_error(None, "Board limit reached")
@@ -151,8 +161,7 @@ class HTMXBoardDeleteView(LoginRequiredMixin, BoardMemberRequiredMixin, DeleteVi
     def get(self, request, *args, **kwargs):
         """Check permissions and render partial/full template."""
         # Check if user has permission to delete (admin/owner only)
-        if not (self.board.owner == request.user or
-                self.board.memberships.filter(user=request.user, role__in=[Membership.ROLE_ADMIN, Membership.ROLE_OWNER]).exists()):
+        if not can_modify_board(self.board, request.user):
             return HttpResponse(status=403)
 
         # For HTMX requests, return partial template
@@ -185,8 +194,7 @@ class HTMXBoardDeleteView(LoginRequiredMixin, BoardMemberRequiredMixin, DeleteVi
     def post(self, request, *args, **kwargs):
         """Check permissions and call delete method."""
         # Check if user has permission to delete (admin/owner only)
-        if not (self.board.owner == request.user or
-                self.board.memberships.filter(user=request.user, role__in=[Membership.ROLE_ADMIN, Membership.ROLE_OWNER]).exists()):
+        if not can_modify_board(self.board, request.user):
             return HttpResponse(status=403)
 
         # We override post just to call our custom delete method.
@@ -364,7 +372,6 @@ class HTMXListDetailView(LoginRequiredMixin, BoardMemberRequiredMixin, DetailVie
         context['cards'] = list_obj.cards.all().order_by('order')
         context['board'] = self.board
         context['list'] = list_obj # self.board.lists.all().order_by('order')
-        custom_logger(f"context: {context}")
         return context
 
 class HTMXListDeleteView(LoginRequiredMixin, BoardMemberRequiredMixin, View):
@@ -419,8 +426,7 @@ class HTMXCardCreateView(LoginRequiredMixin, BoardMemberRequiredMixin, CreateVie
         
         card = form.save(commit=False)
         card.list = card_list
-        max_order = Card.objects.filter(list=card_list).aggregate(max_order=Max('order'))['max_order'] or 0
-        card.order = max_order + 1
+        card.order = reserve_next_card_order(card_list.id)
         card.save()
         
         form.save_m2m()
@@ -529,7 +535,19 @@ class HTMXCardDetailView(LoginRequiredMixin, BoardMemberRequiredMixin, DetailVie
     def get_object(self, queryset=None):
         """Fetch card object for the board."""
         card_id = self.kwargs.get("card_id")
-        return get_object_or_404(Card, id=card_id, list__board=self.board)
+        return get_object_or_404(
+            Card.objects.select_related("list__board").prefetch_related(
+                "assignees",
+                # The assignment form lists the board's active members from this cache.
+                Prefetch(
+                    "list__board__memberships",
+                    queryset=Membership.objects.filter(is_active=True).select_related("user"),
+                    to_attr="active_memberships",
+                ),
+            ),
+            id=card_id,
+            list__board=self.board,
+        )
 
     def get_context_data(self, **kwargs):
         """Add list and board to context."""
@@ -553,18 +571,18 @@ class HTMXCardAssignMembersView(LoginRequiredMixin, BoardMemberRequiredMixin, Vi
         card = get_object_or_404(Card, id=card_id, list__board=self.board)
         member_ids = request.POST.getlist('member_ids')
 
-        # Validate member_ids
-        valid_members = self.board.memberships.filter(user_id__in=member_ids).values_list('user_id', flat=True)
+        # Validate member_ids (one query for all of them)
+        valid_members = list(
+            self.board.memberships.filter(user_id__in=member_ids, is_active=True).values_list('user_id', flat=True)
+        )
         invalid_members = set(member_ids) - set(map(str, valid_members))
 
         if invalid_members:
             messages.error(request, f"Invalid member(s) selected: {', '.join(invalid_members)}")
             return redirect("boards:card_detail", board_id=board_id, list_id=list_id, card_id=card_id)
 
-        # Assign members to the card
-        card.assignees.clear()
-        for member_id in member_ids:
-            card.assignees.add(User.objects.get(id=member_id))
+        # Assign members to the card; set() only writes the difference
+        card.assignees.set(valid_members)
 
         messages.success(request, "Members assigned to the card successfully")
         return redirect("boards:card_detail", board_id=board_id, list_id=list_id, card_id=card_id)
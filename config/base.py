@@ -34,6 +34,7 @@ INSTALLED_APPS = [
     'allauth.socialaccount.providers.google',
     'corsheaders',
     'nested_admin',
+    'cachalot',
     # Local Apps
     'apps.accounts',
     'apps.boards',
@@ -115,6 +116,32 @@ MAX_BOARDS_PER_USER = config('MAX_BOARDS_PER_USER', default=10, cast=int)
 MAX_MEMBERS_PER_BOARD = config('MAX_MEMBERS_PER_BOARD', default=20, cast=int)
 MAX_MEMBERSHIPS_PER_USER = config('MAX_MEMBERSHIPS_PER_USER', default=30, cast=int)
 
+# Query caching (django-cachalot) for the permission-check read path.
+# Cached results are invalidated automatically whenever one of these tables is written.
+# Off by default: invalidation only reaches other processes through a shared cache,
+# which production configures (see config/production.py).
+CACHALOT_ENABLED = config('CACHALOT_ENABLED', default=False, cast=bool)
+CACHALOT_ONLY_CACHABLE_TABLES = frozenset((
+    'boards_membership',
+    'boards_board',
+))
+
+# Logging: the board permission checks log denials at INFO and grants at DEBUG.
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'apps.boards': {
+            'handlers': ['console'],
+            'level': config('BOARDS_LOG_LEVEL', default='INFO'),
+            'propagate': False,
+        },
+    },
+}
+
 # REST Framework, JWT, and dj-rest-auth
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
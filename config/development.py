@@ -29,6 +29,8 @@ try:
                 'PASSWORD': config('DB_PASSWORD', cast=str),
                 'HOST': config('DB_HOST', cast=str),
                 'PORT': config('DB_PORT', cast=str),
+                'CONN_MAX_AGE': config('CONN_MAX_AGE', default=60, cast=int),
+                'CONN_HEALTH_CHECKS': True,
             }
         }
     DATABASES = POSTGRES if PREFERRED_DB == 'postgres' else SQLITE3
@@ -37,6 +39,7 @@ except Exception as e:
     DATABASES = SQLITE3
 
 import os
+import sys
 
 # Celery Configuration (env-driven for Docker/local flexibility)
 CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', 'redis://localhost:6379/0')
@@ -67,3 +70,36 @@ CORS_ALLOWED_ORIGINS = [
     "http://localhost:8080",
 ]
 CORS_ALLOW_CREDENTIALS = True
+
+# Show the permission grants as well as the denials while developing.
+LOGGING['loggers']['apps.boards']['level'] = config('BOARDS_LOG_LEVEL', default='DEBUG')
+
+# Tests: PBKDF2 is deliberately slow, and every fixture user pays for it.
+# A fast hasher keeps test setup cheap; never use it outside the test runner.
+if len(sys.argv) > 1 and sys.argv[1] == 'test':
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+    # Query caching would hide round-trips from the assertNumQueries guards.
+    CACHALOT_ENABLED = False
+
+    # Keep routine grant/denial logs out of the test output; assertLogs still captures them.
+    LOGGING['loggers']['apps.boards']['level'] = 'WARNING'
+
+    # Run the suite on in-memory SQLite whatever PREFERRED_DB says, so test
+    # transactions never touch the disk or a Postgres server.
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': ':memory:',
+        }
+    }
+
+    class DisableMigrations:
+        """Build the test schema straight from the models instead of replaying migrations."""
+        def __contains__(self, item):
+            return True
+
+        def __getitem__(self, item):
+            return None
+
+    MIGRATION_MODULES = DisableMigrations()
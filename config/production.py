@@ -16,9 +16,21 @@ DATABASES = {
         'PASSWORD': config('DB_PASSWORD'),
         'HOST': config('DB_HOST'),
         'PORT': config('DB_PORT', cast=int),
+        # Reuse connections across requests instead of reconnecting every time
+        'CONN_MAX_AGE': config('CONN_MAX_AGE', default=60, cast=int),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
+# Shared Redis cache so cachalot invalidations are seen by every worker
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': config('CACHE_URL', default='redis://redis:6379/1'),
+    }
+}
+CACHALOT_ENABLED = config('CACHALOT_ENABLED', default=True, cast=bool)
+
 # Production email backend (example using SMTP, you'll replace this for Google OAuth)
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
 EMAIL_HOST = config('EMAIL_HOST')